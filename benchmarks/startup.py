@@ -0,0 +1,83 @@
+"""Measures `import pyinject`, loading its public API, and AutoWired decoration and warm-up time per 1,000 functions.
+
+Every run happens in a fresh interpreter so import caches do not skew the results.
+
+Usage: python benchmarks/startup.py [--functions 1000] [--runs 10]
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+RUN_SNIPPET = """
+import json
+import time
+
+started = time.perf_counter()
+import pyinject
+imported = time.perf_counter()
+from pyinject import AutoWired, Depends, warm_up
+loaded = time.perf_counter()
+
+from typing import Annotated
+
+class Service:
+    pass
+
+source = "\\n".join(
+    f"def func_{{i}}(a: int, service: Annotated[Service, Depends()]) -> int:\\n    return a"
+    for i in range({functions})
+)
+namespace = {{"Annotated": Annotated, "Depends": Depends, "Service": Service}}
+exec(compile(source, "<generated>", "exec"), namespace)
+funcs = [namespace[f"func_{{i}}"] for i in range({functions})]
+
+decorating = time.perf_counter()
+decorated = [AutoWired()(func) for func in funcs]
+decorated_at = time.perf_counter()
+
+warm_up()
+warmed_up = time.perf_counter()
+
+print(json.dumps({{
+    "import": imported - started,
+    "load": loaded - imported,
+    "decoration": decorated_at - decorating,
+    "warm_up": warmed_up - decorated_at,
+}}))
+"""
+
+
+def run_once(functions: int) -> dict[str, float]:
+    output = subprocess.check_output(
+        [sys.executable, "-c", RUN_SNIPPET.format(functions=functions)],
+        cwd=ROOT,
+        text=True,
+    )
+    return json.loads(output)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--functions", type=int, default=1000, help="number of decorated functions per run")
+    parser.add_argument("--runs", type=int, default=10, help="number of fresh interpreters to measure")
+    args = parser.parse_args()
+
+    results = [run_once(args.functions) for _ in range(args.runs)]
+    per_thousand = 1000 / args.functions
+
+    print(f"{args.runs} runs, {args.functions} decorated functions, median times")
+    for key, label in (("import", "import pyinject"), ("load", "first access of the public API")):
+        print(f"  {label + ':':<34}{statistics.median(r[key] for r in results) * 1e3:8.3f} ms")
+    for key, label in (("decoration", "decoration"), ("warm_up", "warm-up")):
+        median = statistics.median(r[key] for r in results)
+        print(f"  {label + ' per 1,000 functions:':<34}{median * per_thousand * 1e3:8.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,46 @@
-from .decorators import AutoWired
-from .functions import Depends, create_manager, execute, get_default_manager
+from importlib import import_module
+from typing import TYPE_CHECKING
 
-__all__ = ["AutoWired", "Depends", "execute", "get_default_manager", "create_manager"]
+if TYPE_CHECKING:
+    from .decorators import AutoWired, warm_up
+    from .functions import Depends, create_manager, execute, get_default_manager
+    from .pool import PoolOptions, PoolStats, PoolTimeoutError
+
+__all__ = [
+    "AutoWired",
+    "Depends",
+    "PoolOptions",
+    "PoolStats",
+    "PoolTimeoutError",
+    "execute",
+    "get_default_manager",
+    "create_manager",
+    "warm_up",
+]
+
+# Public names and the submodules defining them, imported on first access to keep `import pyinject` cheap
+_LAZY_ATTRIBUTES = {
+    "AutoWired": "decorators",
+    "Depends": "functions",
+    "PoolOptions": "pool",
+    "PoolStats": "pool",
+    "PoolTimeoutError": "pool",
+    "execute": "functions",
+    "get_default_manager": "functions",
+    "create_manager": "functions",
+    "warm_up": "decorators",
+}
+
+
+def __getattr__(name: str) -> object:
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*(name for name in globals() if name.startswith("__")), *__all__])
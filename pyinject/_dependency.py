@@ -1,13 +1,32 @@
 from dataclasses import dataclass
-from typing import Any, Callable
+from typing import TYPE_CHECKING, Any, Callable, Literal, get_args
+
+if TYPE_CHECKING:
+    from .pool import PoolOptions
+
+DependencyScope = Literal["global", "thread", "task"]
+
+_SCOPES = get_args(DependencyScope)
 
 
 @dataclass(slots=True)
 class _Dependency:
-    """A dependency object, holds a callable that returns a dependency and a cache flag"""
+    """A dependency object, holds a callable that returns a dependency, a cache flag, optional pool options and a cache scope"""
 
     callable: Callable[..., Any] | None = None
     cache: bool = True
+    pool: "PoolOptions | None" = None
+    scope: DependencyScope = "global"
+
+    def __post_init__(self) -> None:
+        if self.scope not in _SCOPES:
+            raise ValueError(f"Unknown dependency scope {self.scope!r}, expected 'global', 'thread' or 'task'")
+
+        if self.scope != "global" and not self.cache:
+            raise ValueError(f"Dependency scope {self.scope!r} only applies to cached dependencies, cache cannot be False")
+
+        if self.scope != "global" and self.pool is not None:
+            raise ValueError(f"Dependency scope {self.scope!r} cannot be combined with a pool, pooled instances are not cached")
 
     @classmethod
     def validate(cls, /, _value: object) -> None:
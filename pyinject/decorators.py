@@ -1,6 +1,19 @@
+import ast
 import inspect
 from functools import wraps
-from typing import Annotated, Any, Callable, ParamSpec, TypeVar, get_args, get_origin
+from types import SimpleNamespace
+from typing import (
+    Annotated,
+    Any,
+    Callable,
+    ForwardRef,
+    ParamSpec,
+    TypeVar,
+    get_args,
+    get_origin,
+    get_type_hints,
+)
+from weakref import WeakSet
 
 from ._dependency import _Dependency
 from .manager import DependenciesManager, default_manager
@@ -9,6 +22,155 @@ R = TypeVar("R", bound=Any)
 P = ParamSpec("P")
 
 
+_PlanEntry = tuple[str, _Dependency | None, Any]
+
+
+class _InjectionPlan:
+    """The parameters of a function that may receive dependencies, resolved once on first use"""
+
+    __slots__ = ["func", "_signature", "_entries", "__weakref__"]
+
+    def __init__(self, func: Callable[..., Any]) -> None:
+        self.func = func
+        self._signature: inspect.Signature | None = None
+        self._entries: tuple[_PlanEntry, ...] | None = None
+        _unresolved_plans.add(self)
+
+    @property
+    def signature(self) -> inspect.Signature:
+        """Returns the signature of the function, inspecting it on first access"""
+        signature = self._signature
+        if signature is None:
+            signature = self._signature = inspect.signature(self.func)
+
+        return signature
+
+    @property
+    def entries(self) -> tuple[_PlanEntry, ...]:
+        """
+        Returns the (parameter name, dependency, annotation) entries of the plan, resolving them on first access
+
+        The dependency is None for plain annotations, which are only injected while globally overridden.
+        """
+        entries = self._entries
+        if entries is None:
+            entries = self._entries = self._resolve()
+            _unresolved_plans.discard(self)
+
+        return entries
+
+    def _resolve(self) -> tuple[_PlanEntry, ...]:
+        """Builds the plan entries, resolving postponed (string) annotations"""
+        annotations = {
+            param_name: param.annotation
+            for param_name, param in self.signature.parameters.items()
+            # Parameters with defaults and variadic parameters are never injected
+            if param.annotation is not inspect.Parameter.empty
+            and param.default is inspect.Parameter.empty
+            and param.kind not in (inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD)
+        }
+
+        if any(_is_postponed(annotation) for annotation in annotations.values()):
+            globalns = self._get_globals()
+            resolved: dict[str, Any] = {}
+
+            for param_name, annotation in annotations.items():
+                if not _is_postponed(annotation):
+                    resolved[param_name] = annotation
+                    continue
+
+                try:
+                    resolved[param_name] = self._evaluate(param_name, annotation, globalns)
+                except NameError:
+                    # Plain annotations are only injected while globally overridden, which an unresolvable one
+                    # (e.g. imported under TYPE_CHECKING) cannot be, so only Annotated dependencies are errors
+                    if _is_annotated(annotation):
+                        raise
+
+            annotations = resolved
+
+        entries: list[_PlanEntry] = []
+
+        for param_name, annotation in annotations.items():
+            # Case of Annotated[<type>, Dependency(...)]
+            if get_origin(annotation) is Annotated:
+                _type, _dependency = get_args(annotation)
+                _Dependency.validate(_dependency)
+                _dependency.callable = _dependency.callable or _type
+                entries.append((param_name, _dependency, annotation))
+
+            # Case of globally overridden dependency without Annotated[<type>, Dependency(...)]
+            else:
+                entries.append((param_name, None, annotation))
+
+        return tuple(entries)
+
+    def _get_globals(self) -> dict[str, Any]:
+        """Returns the globals postponed annotations are evaluated in, those of the innermost wrapped function"""
+        func = self.func
+        while hasattr(func, "__wrapped__"):
+            func = func.__wrapped__
+
+        return getattr(func, "__globals__", {})
+
+    def _evaluate(self, param_name: str, annotation: Any, globalns: dict[str, Any]) -> Any:
+        """
+        Evaluates the postponed annotation of a single parameter
+
+        Only parameters that may be injected are evaluated, so names used by other annotations
+        (e.g. imported under TYPE_CHECKING) do not have to exist at runtime.
+
+        Raises
+        ------
+            NameError: If the annotation refers to a name that cannot be resolved
+
+        """
+        holder = SimpleNamespace(__annotations__={param_name: annotation})
+
+        try:
+            return get_type_hints(holder, globalns=globalns, include_extras=True)[param_name]
+        except NameError as e:
+            raise NameError(
+                f"Unable to resolve the annotation of parameter {param_name!r} of {self.func.__qualname__!r}: {e}.\n"
+                "Forward references must be importable from the module of the function by the time it is first "
+                "called, names local to an enclosing function cannot be resolved.",
+                name=e.name,
+            ) from e
+
+
+# Plans of decorated functions that were neither called nor warmed up yet
+_unresolved_plans: WeakSet[_InjectionPlan] = WeakSet()
+
+
+def _is_postponed(annotation: Any) -> bool:
+    """Whether the annotation, or the type of an Annotated annotation, is a string or a forward reference"""
+    if get_origin(annotation) is Annotated:
+        annotation = get_args(annotation)[0]
+
+    return isinstance(annotation, str | ForwardRef)
+
+
+def _is_annotated(annotation: Any) -> bool:
+    """Whether the annotation is an Annotated annotation, possibly still postponed as a string or forward reference"""
+    if get_origin(annotation) is Annotated:
+        return True
+
+    if isinstance(annotation, ForwardRef):
+        annotation = annotation.__forward_arg__
+
+    if not isinstance(annotation, str):
+        return False
+
+    node = ast.parse(annotation, mode="eval").body
+    if not isinstance(node, ast.Subscript):
+        return False
+
+    # Annotated[...], typing.Annotated[...] or any other module alias
+    return (isinstance(node.value, ast.Name) and node.value.id == "Annotated") or (
+        isinstance(node.value, ast.Attribute) and node.value.attr == "Annotated"
+    )
+
+
 class _AutoWired:
     """A class that resolves dependencies from a callable and injects them to arguments Annotations"""
 
@@ -18,6 +180,9 @@ class _AutoWired:
     def __call__(self, func: Callable[P, R]) -> Callable[P, R]:
         """Decorator that resolves dependencies from a callable and injects them to arguments Annotations.
 
+        The signature and annotations are inspected on the first call (or on warm_up()), which keeps decoration
+        cheap and lets postponed annotations refer to names defined after the decorated function.
+
         Args:
         ----
             func (Callable[P, R]): A callable to be decorated
@@ -27,58 +192,128 @@ class _AutoWired:
             Callable[P, R]: A decorated callable
 
         """
-        sig = inspect.signature(func)
+        plan = _InjectionPlan(func)
 
-        @wraps(func)
-        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
-            bound_args = sig.bind_partial(*args, **kwargs)
-            bound_args.apply_defaults()
+        if inspect.iscoroutinefunction(func):
+            # Pooled dependencies must stay checked out until the coroutine is done, not until it is created,
+            # and are awaited so a full pool does not block the event loop
+
+            @wraps(func)
+            async def async_wrapper(*args: P.args, **kwargs: P.kwargs) -> Any:
+                checked_out: list[tuple[_Dependency, Any]] = []
+                try:
+                    pooled: list[tuple[str, _Dependency]] = []
+                    kwargs_after_injection = self._inject_dependencies_to_kwargs(plan, args, kwargs, checked_out, pooled)
 
-            kwargs_after_injection = self._inject_dependencies_to_kwargs(bound_args, sig, kwargs)
+                    for param_name, _dependency in pooled:
+                        value = await self.manager.get_dependency_value_async(_dependency)
+                        checked_out.append((_dependency, value))
+                        kwargs_after_injection[param_name] = value
 
-            return func(*args, **kwargs_after_injection)
+                    return await func(*args, **kwargs_after_injection)
+                finally:
+                    self._release_dependencies(checked_out)
 
+            async_wrapper.__pyinject_plan__ = plan  # type: ignore[attr-defined]
+            return async_wrapper  # type: ignore[return-value]
+
+        @wraps(func)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            checked_out: list[tuple[_Dependency, Any]] = []
+            try:
+                kwargs_after_injection = self._inject_dependencies_to_kwargs(plan, args, kwargs, checked_out)
+                return func(*args, **kwargs_after_injection)
+            finally:
+                self._release_dependencies(checked_out)
+
+        wrapper.__pyinject_plan__ = plan  # type: ignore[attr-defined]
         return wrapper
 
     def _inject_dependencies_to_kwargs(
         self,
-        bound_args: inspect.BoundArguments,
-        sig: inspect.Signature,
+        plan: _InjectionPlan,
+        args: tuple[Any, ...],
         original_kwargs: dict[str, Any],
+        checked_out: list[tuple[_Dependency, Any]],
+        pooled: list[tuple[str, _Dependency]] | None = None,
     ) -> dict[str, Any]:
         """Injects dependencies to the arguments Annotations.
 
         Args:
         ----
-            bound_args (inspect.BoundArguments): A bound arguments object
-            sig (inspect.Signature): A signature object
-            kwargs (dict[str, Any]): A dictionary containing the keyword arguments
+            plan (_InjectionPlan): The injection plan of the decorated function
+            args (tuple[Any, ...]): The positional arguments
+            original_kwargs (dict[str, Any]): A dictionary containing the keyword arguments
+            checked_out (list[tuple[_Dependency, Any]]): Collects the pooled values that must be released after the call
+            pooled (list[tuple[str, _Dependency]] | None, optional): When given, collects the pooled dependencies
+                to be acquired by the caller instead of acquiring them. Defaults to None.
 
         Returns:
         -------
             dict[str, Any]: A dictionary containing the keyword arguments after injection
 
         """
+        entries = plan.entries
         new_kwargs = original_kwargs.copy()
 
-        for param_name, param in sig.parameters.items():
-            if param_name in bound_args.arguments or param.annotation is inspect.Parameter.empty:
+        if not entries:
+            return new_kwargs
+
+        bound_arguments = plan.signature.bind_partial(*args, **original_kwargs).arguments
+
+        for param_name, _dependency, annotation in entries:
+            if param_name in bound_arguments:
                 continue
 
-            # Case of Annotated[<type>, Dependency(...)]
-            if get_origin(param.annotation) is Annotated:
-                _type, _dependency = get_args(param.annotation)
-                _Dependency.validate(_dependency)
-                _dependency.callable = _dependency.callable or _type
+            if _dependency is not None and _dependency.pool is not None and pooled is not None:
+                pooled.append((param_name, _dependency))
+
+            elif _dependency is not None:
                 new_kwargs[param_name] = self.manager.get_dependency_value(_dependency)
 
-            # Case of globally overridden dependency without Annotated[<type>, Dependency(...)]
-            elif param.annotation in self.manager.dependency_overrides:
-                _dependency = _Dependency(callable=param.annotation, cache=False)
+                if _dependency.pool is not None:
+                    checked_out.append((_dependency, new_kwargs[param_name]))
+
+            elif annotation in self.manager.dependency_overrides:
+                _dependency = _Dependency(callable=annotation, cache=False)
                 new_kwargs[param_name] = self.manager.get_dependency_value(_dependency)
 
         return new_kwargs
 
+    def _release_dependencies(self, checked_out: list[tuple[_Dependency, Any]]) -> None:
+        """Gives the pooled values checked out for a call back to their pools, in reverse order of injection"""
+        for _dependency, value in reversed(checked_out):
+            self.manager.release_dependency_value(_dependency, value)
+
+
+def warm_up(*funcs: Callable[..., Any]) -> None:
+    """
+    Inspects the signatures and resolves the annotations of AutoWired functions ahead of their first call
+
+    Args:
+    ----
+        *funcs (Callable[..., Any]): The AutoWired functions to warm up, all not yet resolved ones when omitted
+
+    Raises:
+    ------
+        TypeError: If one of the functions was not decorated with AutoWired
+        NameError: If an annotation of one of the functions cannot be resolved
+
+    """
+    plans: list[_InjectionPlan] = []
+
+    for func in funcs:
+        plan = getattr(func, "__pyinject_plan__", None)
+        if not isinstance(plan, _InjectionPlan):
+            raise TypeError(
+                f"{func!r} is not an AutoWired function, only functions decorated with AutoWired() can be warmed up.\n"
+                "Decorators applied on top of AutoWired() must use functools.wraps.",
+            )
+        plans.append(plan)
+
+    for plan in plans or list(_unresolved_plans):
+        plan.entries  # noqa: B018
+
 
 def AutoWired(*, manager: DependenciesManager = default_manager) -> Callable[[Callable[P, R]], Callable[P, R]]:  # noqa: N802
     """
@@ -1,12 +1,20 @@
-from typing import Any, Callable, TypeVar
+from typing import TYPE_CHECKING, Any, Callable, TypeVar
 
-from ._dependency import _Dependency
+from ._dependency import DependencyScope, _Dependency
 from .manager import DependenciesManager
 
+if TYPE_CHECKING:
+    from .pool import PoolOptions
+
 R = TypeVar("R", bound=Any)
 
 
-def Depends(_callable: Callable[..., Any] | None = None, cache: bool = True) -> _Dependency:  # noqa: N802, FBT002
+def Depends(  # noqa: N802
+    _callable: Callable[..., Any] | None = None,
+    cache: bool = True,  # noqa: FBT001, FBT002
+    pool: "PoolOptions | None" = None,
+    scope: DependencyScope = "global",
+) -> _Dependency:
     """
     Given a callable, returns a Dependency object that can be used to annotate
 
@@ -14,13 +22,21 @@ def Depends(_callable: Callable[..., Any] | None = None, cache: bool = True) ->
     ----
         callable (Callable[..., Any]): A callable that returns a dependency
         cache (bool, optional): Whether or not to cache the dependency. Defaults to True.
+        pool (PoolOptions | None, optional): Check instances out of a bounded pool for the duration
+            of the injected call instead of caching them, cache is ignored when set. Defaults to None.
+        scope (DependencyScope, optional): Where a cached dependency is shared, "global" shares one instance,
+            "thread" caches one instance per thread and "task" one instance per asyncio task. Defaults to "global".
 
     Returns:
     -------
         _Dependency: A dependency object that can be used to annotate
 
+    Raises:
+    ------
+        ValueError: If the scope is unknown, or is not "global" while cache is False or a pool is set
+
     """
-    return _Dependency(_callable, cache)
+    return _Dependency(_callable, cache, pool, scope)
 
 
 def get_default_manager() -> DependenciesManager:
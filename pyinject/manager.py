@@ -1,26 +1,48 @@
-from threading import Lock
-from typing import Any, Callable
+import sys
+from threading import Lock, local
+from typing import TYPE_CHECKING, Any, Callable
 
 from ._dependency import _Dependency
 
+if TYPE_CHECKING:
+    # The pool module is only imported once a pooled dependency is resolved
+    from .pool import DependencyPool, PoolOptions, PoolStats
+
 OverridesMapping = dict[Callable[..., Any], Callable[..., Any]]
 
 
 class DependenciesManager:
     """A class that manages dependencies and their caching."""
 
-    __slots__ = ["cached_dependencies_values", "_caching_lock", "_overrides_lock", "dependency_overrides"]
+    __slots__ = [
+        "cached_dependencies_values",
+        "_caching_lock",
+        "_overrides_lock",
+        "dependency_overrides",
+        "dependency_pools",
+        "_pools_lock",
+        "_thread_values",
+        "_task_values",
+        "_task_values_lock",
+    ]
 
     def __init__(self) -> None:
         self.cached_dependencies_values: dict[Callable[..., Any], Any] = {}
         self._caching_lock = Lock()
         self._overrides_lock = Lock()
         self.dependency_overrides: OverridesMapping = {}
+        self.dependency_pools: dict[Callable[..., Any], "DependencyPool"] = {}
+        self._pools_lock = Lock()
+        self._thread_values = local()
+        self._task_values: dict[Any, dict[Callable[..., Any], Any]] = {}
+        self._task_values_lock = Lock()
 
     def get_dependency_value(self, _dependency: _Dependency) -> Any:
         """
         Given a _Dependency object, returns the dependency value, caching it if needed
 
+        Pooled dependencies are checked out of their pool and must be given back with release_dependency_value().
+
         Args:
         ----
             _dependency (_Dependency): A _Dependency object
@@ -37,6 +59,19 @@ class DependenciesManager:
             if _dependency.callable in self.dependency_overrides:
                 return self.dependency_overrides[_dependency.callable]()
 
+        if _dependency.pool is not None:
+            return self._get_pool(_dependency.callable, _dependency.pool).acquire()
+
+        if _dependency.cache and _dependency.scope != "global":
+            scope_values = self._get_scope_values(_dependency.scope)
+
+            if _dependency.callable in scope_values:
+                return scope_values[_dependency.callable]
+
+            value = _dependency.callable()
+            scope_values[_dependency.callable] = value
+            return value
+
         with self._caching_lock:
             if _dependency.callable in self.cached_dependencies_values and _dependency.cache:
                 return self.cached_dependencies_values[_dependency.callable]
@@ -49,6 +84,138 @@ class DependenciesManager:
 
         return value
 
+    async def get_dependency_value_async(self, _dependency: _Dependency) -> Any:
+        """
+        Like get_dependency_value(), but waits for a free pooled instance without blocking the event loop
+
+        Args:
+        ----
+            _dependency (_Dependency): A _Dependency object
+
+        Returns:
+        -------
+            Any: The dependency value
+
+        """
+        if _dependency.pool is None or _dependency.callable is None:
+            return self.get_dependency_value(_dependency)
+
+        with self._overrides_lock:
+            if _dependency.callable in self.dependency_overrides:
+                return self.dependency_overrides[_dependency.callable]()
+
+        return await self._get_pool(_dependency.callable, _dependency.pool).acquire_async()
+
+    def release_dependency_value(self, _dependency: _Dependency, value: Any) -> None:
+        """
+        Gives a value obtained from get_dependency_value() back to its pool, if it was checked out of one
+
+        Args:
+        ----
+            _dependency (_Dependency): The _Dependency object the value was obtained for
+            value (Any): The dependency value
+
+        """
+        if _dependency.pool is None or _dependency.callable is None:
+            return
+
+        pool = self.dependency_pools.get(_dependency.callable)
+        if pool is not None:
+            pool.release(value)
+
+    def get_pool_stats(self) -> "dict[Callable[..., Any], PoolStats]":
+        """
+        Returns the statistics of every dependency pool created by this manager.
+
+        Returns
+        -------
+            dict[Callable[..., Any], PoolStats]: A mapping of dependency callables to their pool statistics.
+
+        """
+        with self._pools_lock:
+            pools = list(self.dependency_pools.items())
+
+        return {dependency: pool.stats() for dependency, pool in pools}
+
+    def _get_pool(self, factory: Callable[..., Any], options: "PoolOptions") -> "DependencyPool":
+        """
+        Returns the pool of the given dependency callable, creating it with the given options on first use
+
+        The pool is built outside of the lock, as creating its min_size instances may be slow.
+
+        Raises
+        ------
+            ValueError: If the callable already has a pool with different options
+
+        """
+        pool = self.dependency_pools.get(factory)
+
+        if pool is None:
+            from .pool import DependencyPool
+
+            new_pool = DependencyPool(factory, options)
+
+            with self._pools_lock:
+                pool = self.dependency_pools.setdefault(factory, new_pool)
+
+        if pool.options != options:
+            raise ValueError(
+                f"Dependency {factory!r} is already pooled with {pool.options!r}, "
+                f"it cannot be pooled with different options {options!r}.\n"
+                "Please share a single PoolOptions object between every Depends() of the same dependency.",
+            )
+
+        return pool
+
+    def _get_scope_values(self, scope: str) -> dict[Callable[..., Any], Any]:
+        """
+        Returns the cached values of the current thread or asyncio task.
+
+        Only the first lookup of a task takes a lock, the values are only ever touched by their own thread or task
+        and are dropped once the thread or task ends.
+        """
+        if scope == "thread":
+            try:
+                return self._thread_values.values
+            except AttributeError:
+                self._thread_values.values = {}
+                return self._thread_values.values
+
+        # scope == "task", unknown scopes are rejected when the _Dependency is created
+        task = self._current_task()
+
+        scope_values = self._task_values.get(task)
+        if scope_values is not None:
+            return scope_values
+
+        with self._task_values_lock:
+            scope_values = self._task_values.setdefault(task, {})
+
+        task.add_done_callback(self._drop_task_values)
+        return scope_values
+
+    @staticmethod
+    def _current_task() -> Any:
+        """Returns the running asyncio task, without importing asyncio when nothing else did"""
+        asyncio = sys.modules.get("asyncio")
+        task = None
+
+        if asyncio is not None:
+            try:
+                task = asyncio.current_task()
+            except RuntimeError:
+                task = None
+
+        if task is None:
+            raise RuntimeError("Dependencies with scope='task' can only be resolved inside a running asyncio task")
+
+        return task
+
+    def _drop_task_values(self, task: Any) -> None:
+        """Drops the cached values of a finished asyncio task"""
+        with self._task_values_lock:
+            self._task_values.pop(task, None)
+
     def override_dependencies(self, overrides: OverridesMapping) -> OverridesMapping:
         """
         Overrides the dependencies with the provided overrides.
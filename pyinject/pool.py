@@ -0,0 +1,330 @@
+from collections import deque
+from dataclasses import dataclass
+from threading import Condition
+from time import monotonic
+from typing import Any, Callable
+
+_MISSING = object()
+_RESERVED = object()
+
+
+def _wake_up(waiter: Any) -> None:
+    """Resolves a waiting coroutine's future, from within its event loop"""
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+class PoolTimeoutError(TimeoutError):
+    """Raised when no pooled instance became available within the configured acquire timeout"""
+
+
+@dataclass(frozen=True, slots=True)
+class PoolOptions:
+    """Configuration of a pooled dependency.
+
+    Args:
+    ----
+        min_size (int, optional): Instances created eagerly when the pool is created. Defaults to 0.
+        max_size (int, optional): Maximum number of instances alive at the same time. Defaults to 10.
+        timeout (float | None, optional): Seconds to wait for a free instance, None waits forever. Defaults to None.
+        validate (Callable[[Any], bool] | None, optional): Called with an instance when it is returned to the pool,
+            a falsy result (or an exception) discards the instance instead of reusing it. Defaults to None.
+
+    """
+
+    min_size: int = 0
+    max_size: int = 10
+    timeout: float | None = None
+    validate: Callable[[Any], bool] | None = None
+
+    def __post_init__(self) -> None:
+        if self.min_size < 0:
+            raise ValueError("Pool min_size cannot be negative")
+
+        if self.max_size < 1 or self.max_size < self.min_size:
+            raise ValueError("Pool max_size must be at least 1 and not smaller than min_size")
+
+        if self.timeout is not None and self.timeout < 0:
+            raise ValueError("Pool timeout cannot be negative")
+
+
+@dataclass(frozen=True, slots=True)
+class PoolStats:
+    """A snapshot of a pool's state and counters"""
+
+    size: int
+    idle: int
+    in_use: int
+    max_size: int
+    created: int
+    acquired: int
+    released: int
+    discarded: int
+    timeouts: int
+
+
+class DependencyPool:
+    """A bounded, thread-safe pool of instances created by a dependency callable."""
+
+    __slots__ = [
+        "factory",
+        "options",
+        "_condition",
+        "_idle",
+        "_in_use",
+        "_size",
+        "_created",
+        "_acquired",
+        "_released",
+        "_discarded",
+        "_timeouts",
+        "_async_waiters",
+    ]
+
+    def __init__(self, factory: Callable[..., Any], options: PoolOptions) -> None:
+        self.factory = factory
+        self.options = options
+        self._condition = Condition()
+        self._idle: deque[Any] = deque()
+        self._in_use: dict[int, Any] = {}
+        self._size = 0
+        self._created = 0
+        self._acquired = 0
+        self._released = 0
+        self._discarded = 0
+        self._timeouts = 0
+        self._async_waiters: deque[tuple[Any, Any]] = deque()
+
+        for _ in range(options.min_size):
+            value = factory()
+            if any(value is idle for idle in self._idle):
+                raise ValueError(self._reused_instance_message())
+
+            self._idle.append(value)
+            self._size += 1
+            self._created += 1
+
+    def acquire(self) -> Any:
+        """
+        Checks an instance out of the pool, creating one if the pool is not full yet
+
+        Blocks the calling thread while the pool is full, coroutines must use acquire_async() instead.
+
+        Returns
+        -------
+            Any: A pooled instance, which must be given back with release()
+
+        Raises
+        ------
+            PoolTimeoutError: If no instance became available within the configured timeout
+            ValueError: If the factory returned an instance that is already checked out
+
+        """
+        timeout = self.options.timeout
+        deadline = None if timeout is None else monotonic() + timeout
+
+        with self._condition:
+            while True:
+                value = self._checkout()
+                if value is not _MISSING:
+                    break
+
+                remaining = None if deadline is None else deadline - monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise self._timeout_error()
+
+                self._condition.wait(remaining)
+
+        return self._create() if value is _RESERVED else value
+
+    async def acquire_async(self) -> Any:
+        """
+        Checks an instance out of the pool like acquire(), waiting for a free instance without blocking the event loop
+
+        Returns
+        -------
+            Any: A pooled instance, which must be given back with release()
+
+        Raises
+        ------
+            PoolTimeoutError: If no instance became available within the configured timeout
+            ValueError: If the factory returned an instance that is already checked out
+
+        """
+        # Only ever awaited from a running event loop, so asyncio is already imported
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        timeout = self.options.timeout
+        deadline = None if timeout is None else monotonic() + timeout
+
+        while True:
+            with self._condition:
+                value = self._checkout()
+                if value is _MISSING:
+                    waiter = loop.create_future()
+                    self._async_waiters.append((loop, waiter))
+
+            if value is not _MISSING:
+                return self._create() if value is _RESERVED else value
+
+            remaining = None if deadline is None else deadline - monotonic()
+            try:
+                await asyncio.wait_for(waiter, remaining)
+            except asyncio.TimeoutError:
+                with self._condition:
+                    self._discard_waiter(loop, waiter)
+                    raise self._timeout_error() from None
+            except BaseException:
+                with self._condition:
+                    self._discard_waiter(loop, waiter)
+                raise
+
+    def try_acquire(self) -> Any:
+        """
+        Checks an instance out of the pool if one is idle or can be created, without waiting
+
+        Returns
+        -------
+            Any: A pooled instance, which must be given back with release(), or None if the pool is full
+
+        Raises
+        ------
+            ValueError: If the factory returned an instance that is already checked out
+
+        """
+        with self._condition:
+            value = self._checkout()
+
+        if value is _MISSING:
+            return None
+
+        return self._create() if value is _RESERVED else value
+
+    def _checkout(self) -> Any:
+        """Takes an idle instance, or reserves a slot for a new one (_RESERVED), or returns _MISSING. Requires the lock"""
+        if self._idle:
+            value = self._idle.pop()
+            self._in_use[id(value)] = value
+            self._acquired += 1
+            return value
+
+        if self._size < self.options.max_size:
+            # Reserve the slot now, the instance itself is created outside the lock
+            self._size += 1
+            return _RESERVED
+
+        return _MISSING
+
+    def _create(self) -> Any:
+        """Creates an instance for a slot reserved by _checkout()"""
+        value = _MISSING
+        try:
+            value = self.factory()
+        finally:
+            with self._condition:
+                # Giving the same object to two callers would also make one release go missing and leak its slot
+                reused = value is not _MISSING and id(value) in self._in_use
+
+                if value is _MISSING or reused:
+                    self._size -= 1
+                    self._notify()
+                else:
+                    self._in_use[id(value)] = value
+                    self._created += 1
+                    self._acquired += 1
+
+        if reused:
+            raise ValueError(self._reused_instance_message())
+
+        return value
+
+    def _notify(self) -> None:
+        """Wakes up one waiting thread and one waiting coroutine, they check the pool again. Requires the lock"""
+        self._condition.notify()
+
+        while self._async_waiters:
+            loop, waiter = self._async_waiters.popleft()
+            try:
+                loop.call_soon_threadsafe(_wake_up, waiter)
+            except RuntimeError:
+                # The waiter's event loop is closed, nobody is waiting there anymore
+                continue
+            break
+
+    def _discard_waiter(self, loop: Any, waiter: Any) -> None:
+        """Forgets a coroutine that stopped waiting, passing on a wake up it may have already received. Requires the lock"""
+        try:
+            self._async_waiters.remove((loop, waiter))
+        except ValueError:
+            # Already woken up, so another waiter must get the chance to check the pool
+            self._notify()
+
+    def _timeout_error(self) -> PoolTimeoutError:
+        """Counts a timeout and returns the error to raise. Requires the lock"""
+        self._timeouts += 1
+        return PoolTimeoutError(
+            f"Could not acquire an instance of {self.factory!r} within {self.options.timeout} seconds, "
+            f"all {self.options.max_size} pooled instances are in use",
+        )
+
+    def release(self, value: Any) -> bool:
+        """
+        Returns an instance to the pool, discarding it if it fails validation
+
+        Args:
+        ----
+            value (Any): An instance previously returned by acquire()
+
+        Returns:
+        -------
+            bool: Whether the instance belonged to this pool
+
+        """
+        with self._condition:
+            if self._in_use.pop(id(value), _MISSING) is _MISSING:
+                return False
+            self._released += 1
+
+        try:
+            valid = self.options.validate is None or bool(self.options.validate(value))
+        except Exception:  # noqa: BLE001
+            valid = False
+
+        with self._condition:
+            if valid:
+                self._idle.append(value)
+            else:
+                self._size -= 1
+                self._discarded += 1
+            self._notify()
+
+        return True
+
+    def _reused_instance_message(self) -> str:
+        return (
+            f"Pooled dependency {self.factory!r} returned an instance that is already in its pool,\n"
+            "pooled dependencies must create a new instance on every call."
+        )
+
+    def stats(self) -> PoolStats:
+        """
+        Returns a snapshot of the pool's state and counters
+
+        Returns
+        -------
+            PoolStats: The pool statistics
+
+        """
+        with self._condition:
+            return PoolStats(
+                size=self._size,
+                idle=len(self._idle),
+                in_use=len(self._in_use),
+                max_size=self.options.max_size,
+                created=self._created,
+                acquired=self._acquired,
+                released=self._released,
+                discarded=self._discarded,
+                timeouts=self._timeouts,
+            )
@@ -1,6 +1,10 @@
 from typing import Annotated
+from weakref import WeakSet
 
-from pyinject import AutoWired, Depends
+import pytest
+
+import pyinject.decorators
+from pyinject import AutoWired, Depends, warm_up
 
 
 def foo():
@@ -18,3 +22,44 @@ def func(foo: Annotated[int, Depends(foo)], bar: Annotated[int, Depends(bar)]):
 
 def test_autowired__functions() -> None:
     assert func() == 3  # type: ignore
+
+
+def test_autowired__signature_inspected_lazily() -> None:
+    @AutoWired()
+    def lazy(foo: Annotated[int, Depends(foo)]) -> int:
+        return foo
+
+    plan = lazy.__pyinject_plan__  # type: ignore
+    assert plan._signature is None
+
+    assert lazy() == 1  # type: ignore
+    assert plan._signature is not None
+
+
+def test_autowired__warm_up(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(pyinject.decorators, "_unresolved_plans", WeakSet())
+
+    @AutoWired()
+    def first(foo: Annotated[int, Depends(foo)]) -> int:
+        return foo
+
+    @AutoWired()
+    def second(bar: Annotated[int, Depends(bar)]) -> int:
+        return bar
+
+    warm_up(first)
+    assert first.__pyinject_plan__._entries is not None  # type: ignore
+    assert second.__pyinject_plan__._entries is None  # type: ignore
+
+    warm_up()
+    assert second.__pyinject_plan__._entries is not None  # type: ignore
+    assert len(pyinject.decorators._unresolved_plans) == 0
+
+
+def test_autowired__warm_up_not_autowired() -> None:
+    with pytest.raises(TypeError, match="not an AutoWired function"):
+        warm_up(foo)
+
+
+def test_package__dir() -> None:
+    assert [name for name in dir(pyinject) if not name.startswith("__")] == sorted(pyinject.__all__)
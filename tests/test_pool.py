@@ -0,0 +1,307 @@
+import asyncio
+import threading
+from typing import Annotated
+
+import pytest
+
+from pyinject import AutoWired, Depends, PoolOptions, create_manager
+from pyinject._dependency import _Dependency
+from pyinject.manager import DependenciesManager
+from pyinject.overrider import DependencyOverrider
+from pyinject.pool import DependencyPool, PoolStats, PoolTimeoutError
+
+
+class Parser:
+    def __init__(self) -> None:
+        self.closed = False
+
+
+@pytest.fixture()
+def manager() -> DependenciesManager:
+    return create_manager()
+
+
+def test_pool__instance_is_returned_after_call(manager: DependenciesManager) -> None:
+    @AutoWired(manager=manager)
+    def func(parser: Annotated[Parser, Depends(pool=PoolOptions(max_size=2))]) -> Parser:
+        assert manager.get_pool_stats()[Parser].in_use == 1
+        return parser
+
+    first = func()  # type: ignore
+    second = func()  # type: ignore
+
+    assert first is second
+
+    stats = manager.get_pool_stats()[Parser]
+    assert stats.created == 1
+    assert stats.acquired == 2
+    assert stats.released == 2
+    assert stats.in_use == 0
+    assert stats.idle == 1
+
+
+def test_pool__instance_is_returned_when_call_raises(manager: DependenciesManager) -> None:
+    @AutoWired(manager=manager)
+    def func(parser: Annotated[Parser, Depends(pool=PoolOptions())]) -> None:
+        raise RuntimeError
+
+    with pytest.raises(RuntimeError):
+        func()  # type: ignore
+
+    assert manager.get_pool_stats()[Parser].in_use == 0
+
+
+def test_pool__min_size_is_created_eagerly() -> None:
+    pool = DependencyPool(Parser, PoolOptions(min_size=3, max_size=5))
+
+    stats = pool.stats()
+    assert stats.created == 3
+    assert stats.idle == 3
+    assert stats.size == 3
+
+
+def test_pool__acquire_timeout() -> None:
+    pool = DependencyPool(Parser, PoolOptions(max_size=1, timeout=0.01))
+
+    value = pool.acquire()
+
+    with pytest.raises(PoolTimeoutError):
+        pool.acquire()
+
+    assert pool.stats().timeouts == 1
+
+    pool.release(value)
+    assert pool.acquire() is value
+
+
+def test_pool__acquire_waits_for_release() -> None:
+    pool = DependencyPool(Parser, PoolOptions(max_size=1, timeout=5))
+    value = pool.acquire()
+
+    timer = threading.Timer(0.01, pool.release, args=(value,))
+    timer.start()
+
+    assert pool.acquire() is value
+    timer.join()
+
+
+def test_pool__invalid_instances_are_discarded() -> None:
+    pool = DependencyPool(Parser, PoolOptions(max_size=1, validate=lambda parser: not parser.closed))
+
+    value = pool.acquire()
+    value.closed = True
+    pool.release(value)
+
+    assert pool.acquire() is not value
+
+    stats = pool.stats()
+    assert stats.discarded == 1
+    assert stats.created == 2
+    assert stats.size == 1
+
+
+def test_pool__foreign_values_are_ignored() -> None:
+    pool = DependencyPool(Parser, PoolOptions())
+
+    assert pool.release(Parser()) is False
+    assert pool.stats().released == 0
+
+
+def test_pool__bounded_across_threads(manager: DependenciesManager) -> None:
+    in_use: set[int] = set()
+    lock = threading.Lock()
+
+    @AutoWired(manager=manager)
+    def func(parser: Annotated[Parser, Depends(pool=PoolOptions(max_size=2))]) -> None:
+        with lock:
+            assert id(parser) not in in_use
+            in_use.add(id(parser))
+        with lock:
+            in_use.discard(id(parser))
+
+    threads = [threading.Thread(target=lambda: [func() for _ in range(50)]) for _ in range(8)]  # type: ignore
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    stats = manager.get_pool_stats()[Parser]
+    assert stats.created <= 2
+    assert stats.acquired == stats.released == 400
+
+
+def test_pool__coroutine_holds_instance_until_done(manager: DependenciesManager) -> None:
+    @AutoWired(manager=manager)
+    async def func(parser: Annotated[Parser, Depends(pool=PoolOptions())]) -> int:
+        await asyncio.sleep(0)
+        return manager.get_pool_stats()[Parser].in_use
+
+    assert asyncio.run(func()) == 1  # type: ignore
+    assert manager.get_pool_stats()[Parser].in_use == 0
+
+
+def test_pool__overridden_dependency_is_not_pooled(manager: DependenciesManager) -> None:
+    override = Parser()
+
+    @AutoWired(manager=manager)
+    def func(parser: Annotated[Parser, Depends(pool=PoolOptions())]) -> Parser:
+        return parser
+
+    with DependencyOverrider({Parser: lambda: override}, manager=manager):
+        assert func() is override  # type: ignore
+
+    assert Parser not in manager.get_pool_stats()
+
+
+@pytest.mark.parametrize(
+    "options",
+    [
+        {"min_size": -1},
+        {"max_size": 0},
+        {"min_size": 3, "max_size": 2},
+        {"timeout": -1},
+    ],
+)
+def test_pool_options__invalid(options: dict) -> None:
+    with pytest.raises(ValueError):
+        PoolOptions(**options)
+
+
+def test_pool__conflicting_options_are_rejected(manager: DependenciesManager) -> None:
+    @AutoWired(manager=manager)
+    def func_a(parser: Annotated[Parser, Depends(pool=PoolOptions(max_size=1))]) -> None:
+        ...
+
+    @AutoWired(manager=manager)
+    def func_b(parser: Annotated[Parser, Depends(pool=PoolOptions(max_size=5, timeout=0.01))]) -> None:
+        ...
+
+    func_a()  # type: ignore
+
+    with pytest.raises(ValueError, match="already pooled"):
+        func_b()  # type: ignore
+
+    assert manager.get_pool_stats()[Parser].max_size == 1
+
+
+def test_pool__shared_options_are_accepted(manager: DependenciesManager) -> None:
+    options = PoolOptions(max_size=2)
+
+    @AutoWired(manager=manager)
+    def inner(parser: Annotated[Parser, Depends(pool=options)]) -> Parser:
+        return parser
+
+    @AutoWired(manager=manager)
+    def outer(parser: Annotated[Parser, Depends(pool=options)]) -> bool:
+        return inner() is not parser  # type: ignore
+
+    assert outer() is True  # type: ignore
+    assert manager.get_pool_stats()[Parser].created == 2
+
+
+def test_pool__slow_pool_creation_does_not_block_other_pools(manager: DependenciesManager) -> None:
+    creating = threading.Event()
+    release = threading.Event()
+
+    class SlowConnection:
+        def __init__(self) -> None:
+            creating.set()
+            release.wait(5)
+
+    slow = _Dependency(SlowConnection, pool=PoolOptions(min_size=1))
+    thread = threading.Thread(target=manager.get_dependency_value, args=(slow,))
+    thread.start()
+    creating.wait(5)
+
+    other = threading.Thread(target=manager.get_dependency_value, args=(_Dependency(Parser, pool=PoolOptions()),))
+    other.start()
+    other.join(1)
+    other_blocked = other.is_alive()
+
+    release.set()
+    thread.join()
+    other.join()
+
+    assert not other_blocked
+
+
+def test_pool__factory_returning_checked_out_instance() -> None:
+    shared = Parser()
+    pool = DependencyPool(lambda: shared, PoolOptions(max_size=2))
+
+    assert pool.acquire() is shared
+
+    with pytest.raises(ValueError, match="already in its pool"):
+        pool.acquire()
+
+    assert pool.release(shared) is True
+    assert pool.stats().size == 1
+
+
+def test_pool__factory_returning_same_instance_on_min_size() -> None:
+    shared = Parser()
+
+    with pytest.raises(ValueError, match="already in its pool"):
+        DependencyPool(lambda: shared, PoolOptions(min_size=2))
+
+
+def test_pool__public_exports() -> None:
+    import pyinject
+
+    assert pyinject.PoolTimeoutError is PoolTimeoutError
+    assert pyinject.PoolStats is PoolStats
+
+
+@pytest.mark.parametrize("timeout", [None, 1.0])
+def test_pool__coroutines_wait_without_blocking_the_loop(manager: DependenciesManager, timeout: float | None) -> None:
+    options = PoolOptions(max_size=1, timeout=timeout)
+
+    @AutoWired(manager=manager)
+    async def func(parser: Annotated[Parser, Depends(pool=options)]) -> Parser:
+        await asyncio.sleep(0.1)
+        return parser
+
+    async def main() -> list[Parser]:
+        return await asyncio.wait_for(asyncio.gather(func(), func(), func()), 5)  # type: ignore
+
+    first, second, third = asyncio.run(main())
+
+    assert first is second is third
+    stats = manager.get_pool_stats()[Parser]
+    assert stats.created == 1
+    assert stats.timeouts == 0
+    assert stats.in_use == 0
+
+
+def test_pool__coroutine_acquire_timeout() -> None:
+    pool = DependencyPool(Parser, PoolOptions(max_size=1, timeout=0.01))
+    value = pool.acquire()
+
+    with pytest.raises(PoolTimeoutError):
+        asyncio.run(pool.acquire_async())
+
+    pool.release(value)
+    assert asyncio.run(pool.acquire_async()) is value
+    assert pool.stats().timeouts == 1
+
+
+def test_pool__coroutine_woken_by_release_from_another_thread() -> None:
+    pool = DependencyPool(Parser, PoolOptions(max_size=1, timeout=5))
+    value = pool.acquire()
+
+    timer = threading.Timer(0.01, pool.release, args=(value,))
+    timer.start()
+
+    assert asyncio.run(pool.acquire_async()) is value
+    timer.join()
+
+
+def test_pool__try_acquire() -> None:
+    pool = DependencyPool(Parser, PoolOptions(max_size=1))
+
+    value = pool.try_acquire()
+    assert isinstance(value, Parser)
+    assert pool.try_acquire() is None
+
+    pool.release(value)
+    assert pool.try_acquire() is value
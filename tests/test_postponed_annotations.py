@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Annotated
+
+import pytest
+
+from pyinject import AutoWired, Depends, create_manager, warm_up
+from pyinject.manager import DependenciesManager
+
+if TYPE_CHECKING:
+    from decimal import Decimal
+
+
+@pytest.fixture()
+def manager() -> DependenciesManager:
+    return create_manager()
+
+
+def get_greeting() -> str:
+    return "hello"
+
+
+@AutoWired()
+def func(greeter: Annotated[Greeter, Depends()], greeting: Annotated[str, Depends(get_greeting)]) -> str:
+    return f"{greeting} {greeter.name}"
+
+
+class Greeter:
+    name = "world"
+
+
+@AutoWired()
+def func_unresolvable(missing: Annotated[MissingDependency, Depends()]) -> None:  # type: ignore # noqa: F821
+    ...
+
+
+def test_postponed_annotations__forward_reference() -> None:
+    assert func() == "hello world"  # type: ignore
+
+
+def test_postponed_annotations__global_override(manager: DependenciesManager) -> None:
+    @AutoWired(manager=manager)
+    def func_override(greeter: Greeter) -> str:
+        return greeter.name
+
+    class OtherGreeter(Greeter):
+        name = "other"
+
+    manager.override_dependencies({Greeter: OtherGreeter})
+
+    assert func_override() == "other"  # type: ignore
+
+
+def test_postponed_annotations__resolved_once(monkeypatch: pytest.MonkeyPatch, manager: DependenciesManager) -> None:
+    import pyinject.decorators
+
+    calls: list[object] = []
+    get_type_hints = pyinject.decorators.get_type_hints
+
+    def counting_get_type_hints(*args, **kwargs):  # noqa: ANN002, ANN003, ANN202
+        calls.append(args)
+        return get_type_hints(*args, **kwargs)
+
+    monkeypatch.setattr(pyinject.decorators, "get_type_hints", counting_get_type_hints)
+
+    @AutoWired(manager=manager)
+    def func_counted(greeter: Annotated[Greeter, Depends()]) -> str:
+        return greeter.name
+
+    assert func_counted() == "world"  # type: ignore
+    assert func_counted() == "world"  # type: ignore
+    assert len(calls) == 1
+
+
+def test_postponed_annotations__unresolvable() -> None:
+    with pytest.raises(NameError, match="func_unresolvable.*MissingDependency"):
+        func_unresolvable()  # type: ignore
+
+
+def test_postponed_annotations__unresolvable_on_warm_up() -> None:
+    with pytest.raises(NameError, match="MissingDependency"):
+        warm_up(func_unresolvable)
+
+
+@AutoWired()
+def func_type_checking_only(greeter: Annotated[Greeter, Depends()], amount: Decimal | None = None) -> Decimal:
+    return greeter.name  # type: ignore
+
+
+def test_postponed_annotations__type_checking_only_names_are_not_evaluated() -> None:
+    assert func_type_checking_only() == "world"  # type: ignore
+
+
+@AutoWired()
+def func_type_checking_only_required(amount: Decimal) -> Decimal:
+    return amount
+
+
+def test_postponed_annotations__type_checking_only_required_parameter() -> None:
+    assert func_type_checking_only_required(1) == 1  # type: ignore
+    warm_up(func_type_checking_only_required)
@@ -0,0 +1,110 @@
+import asyncio
+import gc
+import threading
+import weakref
+from typing import Annotated
+
+import pytest
+
+from pyinject import AutoWired, Depends, PoolOptions, create_manager
+from pyinject._dependency import _Dependency
+from pyinject.manager import DependenciesManager
+
+
+class Session:
+    pass
+
+
+@pytest.fixture()
+def manager() -> DependenciesManager:
+    return create_manager()
+
+
+def test_thread_scope__one_instance_per_thread(manager: DependenciesManager) -> None:
+    @AutoWired(manager=manager)
+    def func(session: Annotated[Session, Depends(scope="thread")]) -> Session:
+        return session
+
+    main_session = func()  # type: ignore
+    assert func() is main_session  # type: ignore
+
+    results: list[Session] = []
+    thread = threading.Thread(target=lambda: results.extend([func(), func()]))  # type: ignore
+    thread.start()
+    thread.join()
+
+    assert results[0] is results[1]
+    assert results[0] is not main_session
+    assert Session not in manager.cached_dependencies_values
+
+
+def test_task_scope__one_instance_per_task(manager: DependenciesManager) -> None:
+    @AutoWired(manager=manager)
+    def func(session: Annotated[Session, Depends(scope="task")]) -> Session:
+        return session
+
+    async def in_task() -> tuple[Session, Session]:
+        first = func()  # type: ignore
+        await asyncio.sleep(0)
+        return first, func()  # type: ignore
+
+    async def main() -> list[tuple[Session, Session]]:
+        return await asyncio.gather(in_task(), in_task())
+
+    (first_a, first_b), (second_a, second_b) = asyncio.run(main())
+
+    assert first_a is first_b
+    assert second_a is second_b
+    assert first_a is not second_a
+
+
+def test_thread_scope__values_dropped_when_thread_ends(manager: DependenciesManager) -> None:
+    dependency = _Dependency(Session, scope="thread")
+    references: list[weakref.ref[Session]] = []
+
+    thread = threading.Thread(target=lambda: references.append(weakref.ref(manager.get_dependency_value(dependency))))
+    thread.start()
+    thread.join()
+    gc.collect()
+
+    assert references[0]() is None
+
+
+def test_task_scope__values_dropped_when_task_ends(manager: DependenciesManager) -> None:
+    dependency = _Dependency(Session, scope="task")
+
+    async def in_task() -> None:
+        manager.get_dependency_value(dependency)
+
+    async def main() -> int:
+        await asyncio.create_task(in_task())
+        await asyncio.sleep(0)
+        return len(manager._task_values)
+
+    assert asyncio.run(main()) == 0
+
+
+def test_task_scope__outside_of_task(manager: DependenciesManager) -> None:
+    with pytest.raises(RuntimeError):
+        manager.get_dependency_value(_Dependency(Session, scope="task"))
+
+
+@pytest.mark.parametrize(
+    "options",
+    [
+        {"scope": "process"},
+        {"scope": "thread", "cache": False},
+        {"scope": "task", "cache": False},
+        {"scope": "thread", "pool": PoolOptions()},
+        {"scope": "task", "pool": PoolOptions()},
+    ],
+)
+def test_scope__invalid(options: dict) -> None:
+    with pytest.raises(ValueError):
+        Depends(Session, **options)
+
+
+def test_scope__global_not_cached(manager: DependenciesManager) -> None:
+    dependency = _Dependency(Session, cache=False)
+
+    assert manager.get_dependency_value(dependency) is not manager.get_dependency_value(dependency)